@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import asyncio
 import datetime
-import json
 import re
 import socket
 from typing import Type, Union
@@ -25,6 +24,7 @@ from tornado.web import HTTPError, RequestHandler
 import beer_garden.api.http
 import beer_garden.config as config
 import beer_garden.db.mongo.models
+import beer_garden.json_util as json_util
 from beer_garden.api.http.exceptions import BadRequest, BaseHTTPError
 from beer_garden.api.http.metrics import http_api_latency_total
 from beer_garden.errors import (
@@ -185,13 +185,11 @@ class BaseHandler(RequestHandler):
             typ3 = kwargs["exc_info"][0]
             e = kwargs["exc_info"][1]
 
-            error_dict = None
-            if typ3 in self.error_map.keys():
-                error_dict = self.error_map[typ3]
-            else:
-                for error_type in self.error_map.keys():
+            error_dict = self.error_map.get(typ3)
+            if error_dict is None:
+                for error_type, type_dict in self.error_map.items():
                     if isinstance(e, error_type):
-                        error_dict = self.error_map[error_type]
+                        error_dict = type_dict
                         break
 
             if error_dict:
@@ -226,7 +224,7 @@ class BaseHandler(RequestHandler):
             HTTPError: request has no decoded_body
         """
         if hasattr(self.request, "decoded_body"):
-            return json.loads(self.request.decoded_body)
+            return json_util.loads(self.request.decoded_body)
         else:
             raise HTTPError(
                 400,
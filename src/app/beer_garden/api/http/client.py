@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
-import json
 from inspect import isawaitable
 from typing import Any, Optional
 
-import six
 from brewtils.models import BaseModel
 from brewtils.schema_parser import SchemaParser
 
 import beer_garden.api
+import beer_garden.json_util as json_util
 import beer_garden.router
+from beer_garden.db.mongo.parser import MongoParser
+
+# Whether a result of exactly this type should be json dumped instead of serialized
+# with the SchemaParser. Subclasses and lists are handled by SerializeHelper.json_dump.
+_json_dump_types = {type(None): True, dict: True}
+_json_dump_types.update(dict.fromkeys(SchemaParser._models.values(), False))
 
 
 class SerializeHelper(object):
@@ -25,17 +30,21 @@ class SerializeHelper(object):
             serialize_kwargs["to_string"] = True
 
         # Don't serialize if that's not desired
-        if serialize_kwargs.get("return_raw") or isinstance(result, six.string_types):
+        if serialize_kwargs.get("return_raw") or isinstance(result, str):
             return result
 
         if self.json_dump(result):
-            return json.dumps(result) if serialize_kwargs["to_string"] else result
+            return json_util.dumps(result) if serialize_kwargs["to_string"] else result
 
-        return SchemaParser.serialize(result, **(serialize_kwargs or {}))
+        return MongoParser.serialize(result, **(serialize_kwargs or {}))
 
     @staticmethod
     def json_dump(result: Optional[Any]) -> bool:
         """Determine whether to just json dump the result"""
+        dump = _json_dump_types.get(type(result))
+        if dump is not None:
+            return dump
+
         if result is None:
             return True
 
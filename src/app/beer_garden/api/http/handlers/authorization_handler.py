@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import Type, Union
+from typing import Optional, Sequence, Type, Union
 
 from brewtils.models import BaseModel as BrewtilsModel
 from mongoengine import Document, QuerySet, ValidationError
@@ -45,13 +45,20 @@ class AuthorizationHandler(BaseHandler):
         else:
             return self._anonymous_superuser()
 
-    def get_or_raise(self, model: Type[Document], permission: str, **kwargs):
+    def get_or_raise(
+        self,
+        model: Type[Document],
+        permission: str,
+        exclude_fields: Optional[Sequence[str]] = None,
+        **kwargs,
+    ):
         """Get Document model objects specified by **kwargs if the requesting user
         has the given permission for that object.
 
         Args:
             model: The Document based model class of the object to retrieve
             permission: The permission required to access the object
+            exclude_fields: Fields that should not be loaded from the database
             **kwargs: Used as queryset filter parameters to identify the object
 
         Returns:
@@ -65,8 +72,12 @@ class AuthorizationHandler(BaseHandler):
         """
         provided_filter = Q(**kwargs)
 
+        query_set = model.objects
+        if exclude_fields:
+            query_set = query_set.exclude(*exclude_fields)
+
         try:
-            requested_object = model.objects.get(provided_filter)
+            requested_object = query_set.get(provided_filter)
         except (model.DoesNotExist, ValidationError):
             raise NotFound
 
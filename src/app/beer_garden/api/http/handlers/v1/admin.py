@@ -55,9 +55,7 @@ class AdminAPI(AuthorizationHandler):
         """
         self.verify_user_permission_for_object(GARDEN_UPDATE, local_garden())
 
-        operations = SchemaParser.parse_patch(
-            self.request.decoded_body, many=True, from_string=True
-        )
+        operations = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in operations:
             if op.operation == "rescan":
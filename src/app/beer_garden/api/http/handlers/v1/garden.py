@@ -131,7 +131,7 @@ class GardenAPI(AuthorizationHandler):
         """
         garden = self.get_or_raise(Garden, GARDEN_UPDATE, name=garden_name)
 
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in patch:
             operation = op.operation.lower()
@@ -289,7 +289,7 @@ class GardenListAPI(AuthorizationHandler):
         """
         self.verify_user_permission_for_object(GARDEN_UPDATE, local_garden())
 
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in patch:
             operation = op.operation.lower()
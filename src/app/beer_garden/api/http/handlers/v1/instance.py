@@ -126,7 +126,7 @@ class InstanceAPI(AuthorizationHandler):
         """
         _ = self.get_or_raise(System, INSTANCE_UPDATE, instances__id=instance_id)
 
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in patch:
             operation = op.operation.lower()
@@ -96,7 +96,7 @@ class JobAPI(AuthorizationHandler):
         """
         _ = self.get_or_raise(Job, JOB_UPDATE, id=job_id)
 
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in patch:
             if op.operation == "update":
@@ -109,9 +109,7 @@ class LoggingConfigAPI(AuthorizationHandler):
         """
         self.verify_user_permission_for_object(GARDEN_UPDATE, local_garden())
 
-        patch = SchemaParser.parse_patch(
-            self.request.decoded_body, many=True, from_string=True
-        )
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         response = None
         for op in patch:
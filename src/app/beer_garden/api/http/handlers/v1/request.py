@@ -12,6 +12,7 @@ from brewtils.models import System as BrewtilsSystem
 from brewtils.schema_parser import SchemaParser
 
 import beer_garden.db.api as db
+import beer_garden.json_util as json_util
 from beer_garden.api.authorization import Permissions
 from beer_garden.api.http.base_handler import event_wait
 from beer_garden.api.http.exceptions import BadRequest
@@ -102,7 +103,7 @@ class RequestAPI(AuthorizationHandler):
         _ = self.get_or_raise(Request, REQUEST_UPDATE, id=request_id)
 
         operation = Operation(args=[request_id])
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in patch:
             if op.operation == "replace":
@@ -380,7 +381,7 @@ class RequestListAPI(AuthorizationHandler):
             self.add_header("Access-Control-Expose-Headers", key)
 
         self.set_header("Content-Type", "application/json; charset=UTF-8")
-        self.write(json.dumps(requests))
+        self.write(json_util.dumps_bytes(requests))
 
     async def post(self):
         """
@@ -445,9 +446,7 @@ class RequestListAPI(AuthorizationHandler):
           - Requests
         """
         if self.request.mime_type == "application/json":
-            request_model = self.parser.parse_request(
-                self.request.decoded_body, from_string=True
-            )
+            request_model = self.parser.parse_request(self.request_body)
         elif self.request.mime_type == "application/x-www-form-urlencoded":
             request_model = self._parse_form_request()
         elif self.request.mime_type == "multipart/form-data":
@@ -503,7 +502,9 @@ class RequestListAPI(AuthorizationHandler):
         else:
             # We don't want to echo back the base64 encoding of any file parameters
             remove_bytes_parameter_base64(created_request["parameters"], False)
-            response = SchemaParser.serialize_request(created_request)
+            response = json_util.dumps_bytes(
+                SchemaParser.serialize_request(created_request, to_string=False)
+            )
 
         self.set_status(201)
         self.set_header("Content-Type", "application/json; charset=UTF-8")
@@ -552,9 +553,9 @@ class RequestListAPI(AuthorizationHandler):
         hidden_arg = self.get_query_argument("include_hidden", default="false")
 
         # And parse them into usable forms
-        columns = [json.loads(c) for c in columns_arg]
-        order = json.loads(order_arg)
-        search = json.loads(search_arg)
+        columns = [json_util.loads(c) for c in columns_arg]
+        order = json_util.loads(order_arg)
+        search = json_util.loads(search_arg)
         include_children = bool(child_arg.lower() == "true")
         include_hidden = bool(hidden_arg.lower() == "true")
 
@@ -665,7 +666,7 @@ class RequestListAPI(AuthorizationHandler):
             )
 
         try:
-            request_form_dict = json.loads(request_form)
+            request_form_dict = json_util.loads(request_form)
         except (json.JSONDecodeError):
             raise BadRequest(reason="request parameter must be valid JSON")
 
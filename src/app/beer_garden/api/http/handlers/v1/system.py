@@ -2,8 +2,10 @@
 from brewtils.errors import ModelValidationError
 from brewtils.models import Operation
 from brewtils.schema_parser import SchemaParser
+from brewtils.schemas import PatchSchema
 from brewtils.schemas import SystemSchema as BrewtilsSystemSchema
 
+import beer_garden.json_util as json_util
 from beer_garden.api.authorization import Permissions
 from beer_garden.api.http.handlers import AuthorizationHandler
 from beer_garden.api.http.schemas.v1.system import SystemSansQueueSchema
@@ -15,6 +17,24 @@ SYSTEM_UPDATE = Permissions.SYSTEM_UPDATE.value
 SYSTEM_DELETE = Permissions.SYSTEM_DELETE.value
 
 
+def _parsing_schema(schema_class, **kwargs):
+    """Construct a schema that loads into brewtils models, like the SchemaParser"""
+    schema = schema_class(**kwargs)
+    schema.context["models"] = SchemaParser._models
+
+    return schema
+
+
+# Constructing schemas is expensive, so these are built once and shared. That's safe
+# because handlers only ever run on the IO loop thread.
+_patch_schema = _parsing_schema(PatchSchema, many=True)
+_system_schema = _parsing_schema(BrewtilsSystemSchema)
+_sans_queue_schemas = {
+    False: SystemSansQueueSchema(),
+    True: SystemSansQueueSchema(many=True),
+}
+
+
 def _remove_queue_info(response: str, many: bool = False) -> str:
     """Strips out the queue_type and queue_info from the Systems response json.
 
@@ -24,8 +44,18 @@ def _remove_queue_info(response: str, many: bool = False) -> str:
     risky. Instead, this takes the serialized response and just runs it through another
     Schema that strips out the queue info.
     """
-    system_data = SystemSansQueueSchema(many=many).loads(response).data
-    return SystemSansQueueSchema(many=many).dumps(system_data).data
+    schema = _sans_queue_schemas[many]
+
+    return schema.dumps(schema.loads(response).data).data
+
+
+def _serialize_sans_queue(system) -> bytes:
+    """Serialize a System without its instances' queue_type and queue_info
+
+    Unlike _remove_queue_info this works on the model itself, so it's only serialized
+    once rather than serialized, parsed and serialized again.
+    """
+    return json_util.dumps_bytes(_sans_queue_schemas[False].dump(system).data)
 
 
 class SystemAPI(AuthorizationHandler):
@@ -57,17 +87,19 @@ class SystemAPI(AuthorizationHandler):
         tags:
           - Systems
         """
-        system = self.get_or_raise(System, SYSTEM_READ, id=system_id)
-
         # This is only here because of backwards compatibility
         include_commands = (
             self.get_query_argument("include_commands", default="").lower() != "false"
         )
 
-        if not include_commands:
-            system.commands = []
+        system = self.get_or_raise(
+            System,
+            SYSTEM_READ,
+            exclude_fields=None if include_commands else ["commands"],
+            id=system_id,
+        )
 
-        response = SystemSansQueueSchema().dump(system).data
+        response = _sans_queue_schemas[False].dump(system).data
 
         self.set_header("Content-Type", "application/json; charset=UTF-8")
         self.write(response)
@@ -169,7 +201,7 @@ class SystemAPI(AuthorizationHandler):
 
         response = ""
 
-        for op in SchemaParser.parse_patch(self.request.decoded_body, from_string=True):
+        for op in _patch_schema.load(self.request_body).data:
             if op.operation == "replace":
                 if op.path == "/commands":
                     kwargs["new_commands"] = SchemaParser.parse_command(
@@ -213,11 +245,12 @@ class SystemAPI(AuthorizationHandler):
                 raise ModelValidationError(f"Unsupported operation '{op.operation}'")
 
         if kwargs:
-            response = _remove_queue_info(
+            response = _serialize_sans_queue(
                 await self.client(
                     Operation(
                         operation_type="SYSTEM_UPDATE", args=[system_id], kwargs=kwargs
-                    )
+                    ),
+                    serialize_kwargs={"return_raw": True},
                 )
             )
 
@@ -231,7 +264,7 @@ class SystemAPI(AuthorizationHandler):
 
 
 class SystemListAPI(AuthorizationHandler):
-    REQUEST_FIELDS = set(BrewtilsSystemSchema.get_attribute_names())
+    REQUEST_FIELDS = frozenset(BrewtilsSystemSchema.get_attribute_names())
 
     async def get(self):
         """
@@ -299,19 +332,21 @@ class SystemListAPI(AuthorizationHandler):
 
         order_by = self.get_query_argument("order_by", None)
 
-        dereference_nested = self.get_query_argument("dereference_nested", None)
-        if dereference_nested is None:
-            dereference_nested = True
-        else:
-            dereference_nested = bool(dereference_nested.lower() == "true")
+        dereference_nested = (
+            self.get_query_argument("dereference_nested", "true").lower() == "true"
+        )
 
         include_fields = self.get_query_argument("include_fields", None)
         if include_fields:
-            include_fields = set(include_fields.split(",")) & self.REQUEST_FIELDS
+            include_fields = {
+                f for f in include_fields.split(",") if f in self.REQUEST_FIELDS
+            }
 
         exclude_fields = self.get_query_argument("exclude_fields", None)
         if exclude_fields:
-            exclude_fields = set(exclude_fields.split(",")) & self.REQUEST_FIELDS
+            exclude_fields = {
+                f for f in exclude_fields.split(",") if f in self.REQUEST_FIELDS
+            }
 
         # TODO - Handle multiple query arguments with the same key
         # for example: (?name=foo&name=bar) ... what should that mean?
@@ -374,7 +409,7 @@ class SystemListAPI(AuthorizationHandler):
         tags:
           - Systems
         """
-        system = SchemaParser.parse_system(self.request.decoded_body, from_string=True)
+        system = _system_schema.load(self.request_body).data
 
         self.verify_user_permission_for_object(SYSTEM_CREATE, system)
 
@@ -382,8 +417,9 @@ class SystemListAPI(AuthorizationHandler):
             Operation(
                 operation_type="SYSTEM_CREATE",
                 args=[system],
-            )
+            ),
+            serialize_kwargs={"return_raw": True},
         )
         self.set_status(201)
         self.set_header("Content-Type", "application/json; charset=UTF-8")
-        self.write(_remove_queue_info(response))
+        self.write(_serialize_sans_queue(response))
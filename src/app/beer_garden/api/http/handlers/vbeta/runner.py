@@ -115,7 +115,7 @@ class RunnerAPI(BaseHandler):
         tags:
           - Runners
         """
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in patch:
             operation = op.operation.lower()
@@ -204,7 +204,7 @@ class RunnerListAPI(BaseHandler):
         tags:
           - Runners
         """
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
+        patch = SchemaParser.parse_patch(self.request_body, many=True)
 
         for op in patch:
             operation = op.operation.lower()
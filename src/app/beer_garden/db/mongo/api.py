@@ -8,7 +8,6 @@ from brewtils.models import BaseModel
 from brewtils.schema_parser import SchemaParser
 from mongoengine import (
     ConnectionFailure,
-    DoesNotExist,
     NotUniqueError,
     QuerySet,
     connect,
@@ -64,6 +63,12 @@ for model_name in beer_garden.db.mongo.models.__all__:
     if brewtils_model:
         _model_map[brewtils_model] = mongo_class
 
+# Bound once here since these are called for every conversion to or from the database
+_serialize_brewtils = SchemaParser.serialize
+_parse_brewtils = SchemaParser.parse
+_serialize_mongo = MongoParser.serialize
+_parse_mongo = MongoParser.parse
+
 
 def from_brewtils(obj: ModelItem) -> MongoModel:
     """Convert an item from its Brewtils model to its Mongo one.
@@ -75,8 +80,8 @@ def from_brewtils(obj: ModelItem) -> MongoModel:
         The Mongo model item
 
     """
-    model_dict = SchemaParser.serialize(obj, to_string=False)
-    mongo_obj = MongoParser.parse(model_dict, type(obj), from_string=False)
+    model_dict = _serialize_brewtils(obj, to_string=False)
+    mongo_obj = _parse_mongo(model_dict, type(obj), from_string=False)
     return mongo_obj
 
 
@@ -108,8 +113,8 @@ def to_brewtils(
     if getattr(obj, "pre_serialize", None):
         obj.pre_serialize()
 
-    serialized = MongoParser.serialize(obj, to_string=True)
-    parsed = SchemaParser.parse(serialized, model_class, from_string=True, many=many)
+    serialized = _serialize_mongo(obj, to_string=True)
+    parsed = _parse_brewtils(serialized, model_class, from_string=True, many=many)
 
     return parsed
 
@@ -257,19 +262,31 @@ def query_unique(
         mongoengine.MultipleObjectsReturned: More than one matching item exists
 
     """
-    try:
-        for k, v in kwargs.items():
-            if isinstance(v, BaseModel):
-                kwargs[k] = from_brewtils(v)
+    for k, v in kwargs.items():
+        if isinstance(v, BaseModel):
+            kwargs[k] = from_brewtils(v)
 
-        query_set = _model_map[model_class].objects.get(**kwargs)
+    mongo_class = _model_map[model_class]
 
-        return to_brewtils(query_set)
-    except DoesNotExist:
+    # This is what QuerySet.get does, but a miss is common enough (things get polled
+    # by ID after they've been removed) that it's worth not raising and catching
+    # DoesNotExist just to return None
+    matches = list(mongo_class.objects(**kwargs).order_by().limit(2))
+
+    if not matches:
         if raise_missing:
-            raise
+            raise mongo_class.DoesNotExist(
+                f"{mongo_class.__name__} matching query does not exist."
+            )
         return None
 
+    if len(matches) > 1:
+        raise mongo_class.MultipleObjectsReturned(
+            "2 or more items returned, instead of 1"
+        )
+
+    return to_brewtils(matches[0])
+
 
 def query(
     model_class: ModelType, q_filter: Union[Q, QCombination, None] = None, **kwargs
@@ -298,46 +315,53 @@ def query(
         A list of Brewtils models
 
     """
-    query_set = _model_map[model_class].objects
+    mongo_class = _model_map[model_class]
+    query_set = mongo_class.objects
 
     if q_filter:
         query_set = query_set.filter(q_filter)
 
-    if kwargs.get("filter_params"):
-        filter_params = kwargs["filter_params"]
-
+    filter_params = kwargs.get("filter_params")
+    if filter_params:
         # If any values are brewtils models those need to be converted
-        for key in filter_params:
-            if isinstance(filter_params[key], BaseModel):
-                filter_params[key] = from_brewtils(filter_params[key])
+        for key, value in filter_params.items():
+            if isinstance(value, BaseModel):
+                filter_params[key] = from_brewtils(value)
 
-        query_set = query_set.filter(**(kwargs.get("filter_params", {})))
+        query_set = query_set.filter(**filter_params)
 
     # Bad things happen if you try to use a hint with a text search.
-    if kwargs.get("text_search"):
-        query_set = query_set.search_text(kwargs.get("text_search"))
-    elif kwargs.get("hint"):
+    text_search = kwargs.get("text_search")
+    hint = kwargs.get("hint")
+    if text_search:
+        query_set = query_set.search_text(text_search)
+    elif hint:
         # Sanity check - if index is 'bad' just let mongo deal with it
-        if kwargs.get("hint") in _model_map[model_class].index_names():
-            query_set = query_set.hint(kwargs.get("hint"))
+        if hint in mongo_class.index_names():
+            query_set = query_set.hint(hint)
 
-    if kwargs.get("order_by"):
-        query_set = query_set.order_by(kwargs.get("order_by"))
+    order_by = kwargs.get("order_by")
+    if order_by:
+        query_set = query_set.order_by(order_by)
 
-    if kwargs.get("include_fields"):
-        query_set = query_set.only(*kwargs.get("include_fields"))
+    include_fields = kwargs.get("include_fields")
+    if include_fields:
+        query_set = query_set.only(*include_fields)
 
-    if kwargs.get("exclude_fields"):
-        query_set = query_set.exclude(*kwargs.get("exclude_fields"))
+    exclude_fields = kwargs.get("exclude_fields")
+    if exclude_fields:
+        query_set = query_set.exclude(*exclude_fields)
 
     if not kwargs.get("dereference_nested", True):
         query_set = query_set.no_dereference()
 
-    if kwargs.get("start"):
-        query_set = query_set.skip(int(kwargs.get("start")))
+    start = kwargs.get("start")
+    if start:
+        query_set = query_set.skip(int(start))
 
-    if kwargs.get("length"):
-        query_set = query_set.limit(int(kwargs.get("length")))
+    length = kwargs.get("length")
+    if length:
+        query_set = query_set.limit(int(length))
 
     return [] if len(query_set) == 0 else to_brewtils(query_set)
 
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
+import threading
+from collections import OrderedDict
 from copy import copy
 
+import brewtils.models
+import brewtils.schemas
 from brewtils.schema_parser import SchemaParser
 
 import beer_garden.db.mongo.models
+import beer_garden.json_util as json_util
 
 
 class MongoParser(SchemaParser):
@@ -32,6 +37,115 @@ class MongoParser(SchemaParser):
         }
     )
 
+    # Schema instances are expensive to construct, so they're kept around for reuse.
+    # Marshmallow schemas are not guaranteed to be thread-safe, so each thread gets
+    # its own cache. Clients can choose the only / exclude fields, so the cache is
+    # bounded and the least recently used schema is dropped when it's full.
+    _schema_cache = threading.local()
+    _schema_cache_size = 32
+
+    @classmethod
+    def parse(cls, data, model_class, from_string=False, **kwargs):
+        """Convert a JSON string or dictionary into a model object
+
+        This is the same as SchemaParser.parse except that the schema used is reused
+        between calls.
+        """
+        if data is None:
+            raise TypeError("Data can not be None")
+
+        if from_string and not isinstance(data, str):
+            raise TypeError("When from_string=True data must be a string-type")
+
+        if model_class == brewtils.models.PatchOperation:
+            kwargs["many"] = True
+
+        schema = cls._get_schema(model_class.schema, **kwargs)
+
+        return schema.loads(data).data if from_string else schema.load(data).data
+
+    @classmethod
+    def serialize(cls, model, to_string=False, schema_name=None, **kwargs):
+        """Convert a model object or list of models into a dictionary or JSON string
+
+        This is the same as SchemaParser.serialize except that the schema used is
+        reused between calls and collections of a single model type are serialized in
+        one pass.
+        """
+        schema_name = schema_name or cls._get_schema_name(model)
+
+        if cls._single_item(model):
+            kwargs["many"] = False
+
+            schema = cls._get_schema(schema_name, **kwargs)
+
+            return schema.dumps(model).data if to_string else schema.dump(model).data
+
+        model = list(model)
+
+        if not schema_name and model:
+            model_type = type(model[0])
+
+            if all(type(x) is model_type for x in model):
+                schema_name = cls._get_schema_name(model[0])
+
+        if schema_name:
+            kwargs["many"] = True
+
+            schema = cls._get_schema(schema_name, **kwargs)
+
+            return schema.dumps(model).data if to_string else schema.dump(model).data
+
+        # Explicitly force to_string to False so only original call returns a string
+        multiple = [
+            cls.serialize(x, to_string=False, schema_name=schema_name, **kwargs)
+            for x in model
+        ]
+
+        return json_util.dumps(multiple) if to_string else multiple
+
+    @classmethod
+    def _get_schema(cls, schema_name, **kwargs):
+        """Get a schema instance, constructing and caching it if necessary
+
+        Args:
+            schema_name: Name of the schema class in brewtils.schemas
+            **kwargs: Parameters to be passed to the Schema
+
+        Returns:
+            The schema instance
+        """
+        try:
+            key = (
+                schema_name,
+                frozenset(
+                    (k, frozenset(v) if isinstance(v, (list, set, tuple)) else v)
+                    for k, v in kwargs.items()
+                ),
+            )
+        except TypeError:
+            key = None
+
+        cache = getattr(cls._schema_cache, "schemas", None)
+        if cache is None:
+            cache = cls._schema_cache.schemas = OrderedDict()
+
+        schema = cache.get(key) if key else None
+
+        if schema is not None:
+            cache.move_to_end(key)
+        else:
+            schema = getattr(brewtils.schemas, schema_name)(**kwargs)
+            schema.context["models"] = cls._models
+
+            if key:
+                cache[key] = schema
+
+                if len(cache) > cls._schema_cache_size:
+                    cache.popitem(last=False)
+
+        return schema
+
     @classmethod
     def _get_schema_name(cls, obj):
         if isinstance(obj, beer_garden.db.mongo.models.MongoModel):
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""JSON helpers
+
+These use orjson when it is installed, since it is considerably faster than the
+standard library json module. If orjson is not available, or if it refuses to handle a
+particular value (integers larger than 64 bits, non-string dictionary keys, etc.) the
+standard library is used instead.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize a JSON document
+
+    Args:
+        data: The JSON document
+
+    Returns:
+        The deserialized object
+
+    Raises:
+        json.JSONDecodeError: The document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (NaN, for instance)
+            pass
+
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+
+    return json.dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON
+
+    This avoids decoding orjson's output only for it to be encoded again when it's
+    written somewhere that accepts bytes (an HTTP response, for instance).
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+
+    return json.dumps(obj).encode("utf-8")
@@ -377,6 +377,7 @@ class PluginManager(StoppableThread):
 
         if remove:
             self._runners.remove(the_runner)
+            the_runner.release_streams()
 
         return the_runner.state()
 
@@ -507,6 +508,7 @@ class PluginManager(StoppableThread):
 
         for the_runner in the_runners:
             self._runners.remove(the_runner)
+            the_runner.release_streams()
 
     def _get_runner_id(self) -> str:
         """Get a 10-letter string to serve as a runner ID."""
@@ -1,33 +1,294 @@
 # -*- coding: utf-8 -*-
 import logging
+import os
+import selectors
+import signal
 import subprocess
-from io import TextIOBase
 from pathlib import Path
-from threading import Thread
-from typing import Sequence
+from threading import Event, Lock, Thread
+from typing import IO, Dict, List, Optional, Sequence, Set, Tuple
 
 from brewtils.models import Runner
 
-log_levels = [n for n in logging._nameToLevel.keys()]
+# Maximum number of bytes to read from a plugin's output stream at once
+READ_SIZE = 65536
 
+# File handlers for captured plugin output, and the names of the loggers using them,
+# by file path
+_stream_handlers: Dict[Path, Tuple[logging.FileHandler, Set[str]]] = {}
+_stream_handlers_lock = Lock()
 
-def read_stream(process: subprocess.Popen, stream: TextIOBase, logger: logging.Logger):
-    """Helper function thread target to read a subprocess IO stream
+_output_reader: Optional["OutputReader"] = None
+_output_reader_lock = Lock()
 
-    This will read line by line from STDOUT or STDERR and log each line at INFO level.
-    Loggers passed to this function should have handlers configured to log at that level
-    (or propagate to a logger than can), otherwise this function is pointless.
+
+class OutputReader(Thread):
+    """Thread that reads the captured output streams of plugin processes
+
+    Instead of each plugin having a thread blocked on its pipes, every stream is
+    registered with a single selector and read from this thread. Each line read from a
+    stream is logged at INFO level, using the logger paired with that stream. Loggers
+    should have handlers configured to log at that level (or propagate to a logger that
+    can), otherwise this is pointless.
+
+    Reading a stream stops at EOF, which happens once the process (and anything it
+    spawned that inherited the stream) has closed it.
     """
-    stream_reader = iter(stream.readline, "")
 
-    # Sometimes the iter can finish before the process is really done
-    while process.poll() is None:
-        for raw_line in stream_reader:
-            logger.info(raw_line.rstrip())
+    def __init__(self):
+        super().__init__(name="Plugin Output Reader", daemon=True)
+
+        self.logger = logging.getLogger(f"{__name__}.OutputReader")
+
+        self._selector = selectors.DefaultSelector()
+        self._pending: List[Tuple[IO, logging.Logger, _StreamGroup]] = []
+        self._pending_lock = Lock()
+        self._stopped = Event()
+
+        # The selector can't be modified while another thread is waiting on it, so new
+        # streams are queued and this pipe is used to wake the reader to register them
+        self._wake_read, self._wake_write = os.pipe()
+        self._selector.register(self._wake_read, selectors.EVENT_READ)
+
+    def add(self, streams: Dict[IO, logging.Logger]) -> Event:
+        """Start reading streams
+
+        Args:
+            streams: The streams to read, and the logger to use for each
+
+        Returns:
+            An Event that will be set once every one of the streams has been closed (or
+            the reader has been stopped)
+        """
+        group = _StreamGroup(len(streams))
+
+        with self._pending_lock:
+            if self._stopped.is_set():
+                group.closed.set()
+            else:
+                self._pending.extend(
+                    (stream, logger, group) for stream, logger in streams.items()
+                )
+                self._wake()
+
+        return group.closed
+
+    def stop(self):
+        """Stop reading
+
+        Streams that haven't reached EOF are abandoned and anything waiting on them is
+        released.
+        """
+        with self._pending_lock:
+            if not self._stopped.is_set():
+                self._stopped.set()
+                self._wake()
+
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def run(self):
+        try:
+            while not self._stopped.is_set():
+                for key, _ in self._selector.select():
+                    if key.fd == self._wake_read:
+                        self._drain_wake()
+                        self._register_pending()
+                        continue
+
+                    try:
+                        self._read(key)
+                    except Exception as ex:
+                        # One bad stream must not stop output for every other plugin
+                        self.logger.exception(f"Error reading plugin output: {ex}")
+                        self._close(key)
+        finally:
+            self._shutdown()
+
+    def _wake(self):
+        os.write(self._wake_write, b"\0")
+
+    def _drain_wake(self):
+        try:
+            os.read(self._wake_read, READ_SIZE)
+        except OSError as ex:
+            self.logger.exception(f"Error reading wakeup pipe: {ex}")
+
+    def _register_pending(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+
+        for stream, logger, group in pending:
+            try:
+                self._selector.register(
+                    stream, selectors.EVENT_READ, (logger, bytearray(), group)
+                )
+            except Exception as ex:
+                self.logger.exception(f"Unable to read plugin output: {ex}")
+                group.stream_closed()
+
+    def _read(self, key: selectors.SelectorKey):
+        logger, buffer, group = key.data
+
+        try:
+            data = os.read(key.fd, READ_SIZE)
+        except OSError:
+            data = b""
+
+        if data:
+            # Only complete lines are logged, anything after the last newline stays in
+            # the buffer until the rest of the line arrives
+            buffer += data
+            end = buffer.rfind(b"\n") + 1
+            lines = buffer[: end - 1].split(b"\n") if end else []
+            del buffer[:end]
+        else:
+            lines = [buffer] if buffer else []
+
+        for line in lines:
+            # The newline is gone already, but \r\n endings leave a \r behind
+            if line.endswith(b"\r"):
+                line = line[:-1]
+
+            logger.info(line.decode("utf-8", "replace"))
+
+        if not data:
+            self._close(key)
+
+    def _close(self, key: selectors.SelectorKey):
+        """Stop reading a stream and mark it as closed"""
+        try:
+            self._selector.unregister(key.fileobj)
+        except (KeyError, ValueError):
+            pass
+
+        key.data[2].stream_closed()
+
+    def _shutdown(self):
+        for key in list(self._selector.get_map().values()):
+            if key.fd != self._wake_read:
+                self._close(key)
+
+        with self._pending_lock:
+            self._stopped.set()
+            pending, self._pending = self._pending, []
+
+        for _, _, group in pending:
+            group.closed.set()
+
+        self._selector.close()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+
+class _StreamGroup:
+    """Tracks when all the streams passed to a single OutputReader.add are closed"""
+
+    def __init__(self, count: int):
+        self.remaining = count
+        self.closed = Event()
+
+        if not count:
+            self.closed.set()
+
+    def stream_closed(self):
+        # Only ever called from the OutputReader thread, so no lock needed
+        self.remaining -= 1
+
+        if not self.remaining:
+            self.closed.set()
+
+
+def output_reader() -> OutputReader:
+    """Get the OutputReader shared by all runners, starting it if necessary"""
+    global _output_reader
+
+    with _output_reader_lock:
+        if _output_reader is None or _output_reader.stopped():
+            _output_reader = OutputReader()
+            _output_reader.start()
+
+    return _output_reader
+
+
+def stream_logger(name: str, path: Path) -> logging.Logger:
+    """Get a logger that writes captured plugin output to the given file
+
+    Restarted runners keep their runner ID, so the logger may already exist and have
+    the handler attached. And every instance of a plugin writes to the same files. So
+    there's one FileHandler per file, shared by every logger that writes to it, and it's
+    only attached to a logger once.
+
+    The file may have been rotated or removed (along with the rest of the plugin
+    directory) since the handler was opened, so that's checked here, once per runner
+    start, rather than on every line written.
+    """
+    with _stream_handlers_lock:
+        entry = _stream_handlers.get(path)
+
+        if entry is None:
+            handler = logging.FileHandler(path)
+            handler.setFormatter(
+                logging.Formatter(fmt="%(asctime)s %(name)s: %(message)s")
+            )
+            entry = _stream_handlers[path] = (handler, set())
+        else:
+            _reopen_if_replaced(entry[0])
+
+        handler, users = entry
+        users.add(name)
+
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel("DEBUG")
+
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+
+    return logger
+
+
+def release_stream_logger(name: str, path: Path) -> None:
+    """Stop a logger from writing captured plugin output to the given file
+
+    The file is closed once no logger is writing to it.
+    """
+    with _stream_handlers_lock:
+        entry = _stream_handlers.get(path)
+
+        if entry is None:
+            return
+
+        handler, users = entry
+
+        logging.getLogger(name).removeHandler(handler)
+        users.discard(name)
+
+        if not users:
+            del _stream_handlers[path]
+            handler.close()
+
+
+def _reopen_if_replaced(handler: logging.FileHandler) -> None:
+    """Reopen a handler's file if the one it has open is no longer at its path"""
+    handler.acquire()
+    try:
+        opened = os.fstat(handler.stream.fileno())
+
+        try:
+            replaced = not os.path.samestat(opened, os.stat(handler.baseFilename))
+        except FileNotFoundError:
+            replaced = True
+
+        if replaced:
+            stream = open(handler.baseFilename, handler.mode, encoding=handler.encoding)
+            handler.setStream(stream).close()
+    finally:
+        handler.release()
 
 
 class StreamReader:
-    """Context manager responsible for managing stream reading threads"""
+    """Context manager responsible for capturing a plugin process's output streams"""
 
     def __init__(self, runner):
         self.runner = runner
@@ -35,50 +296,24 @@ class StreamReader:
         self.process_cwd = runner.process_cwd
         self.capture_streams = runner.capture_streams
 
-        self.stdout_thread = None
-        self.stderr_thread = None
+        self.streams_closed = None
 
     def __enter__(self):
         if not self.capture_streams:
             return
 
-        format_str = "%(asctime)s %(name)s: %(message)s"
-
-        stdout_handler = logging.FileHandler(self.process_cwd / "plugin.stdout")
-        stdout_handler.setFormatter(logging.Formatter(fmt=format_str))
-
-        stderr_handler = logging.FileHandler(self.process_cwd / "plugin.stderr")
-        stderr_handler.setFormatter(logging.Formatter(fmt=format_str))
-
-        stdout_logger = logging.getLogger(f"{self.runner.runner_id}.stdout")
-        stdout_logger.addHandler(stdout_handler)
-        stdout_logger.propagate = False
-        stdout_logger.setLevel("DEBUG")
-
-        stderr_logger = logging.getLogger(f"{self.runner.runner_id}.stderr")
-        stderr_logger.addHandler(stderr_handler)
-        stderr_logger.propagate = False
-        stderr_logger.setLevel("DEBUG")
+        stdout_name, stderr_name = self.runner.stream_loggers()
 
-        self.stdout_thread = Thread(
-            target=read_stream,
-            args=(self.process, self.process.stdout, stdout_logger),
-            name=f"{self.runner} STDOUT Reader",
+        self.streams_closed = output_reader().add(
+            {
+                self.process.stdout: stream_logger(*stdout_name),
+                self.process.stderr: stream_logger(*stderr_name),
+            }
         )
-        self.stderr_thread = Thread(
-            target=read_stream,
-            args=(self.process, self.process.stderr, stderr_logger),
-            name=f"{self.runner} STDERR Reader",
-        )
-
-        self.stdout_thread.start()
-        self.stderr_thread.start()
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        if self.stdout_thread and self.stdout_thread.is_alive():
-            self.stdout_thread.join()
-        if self.stderr_thread and self.stderr_thread.is_alive():
-            self.stderr_thread.join()
+        if self.streams_closed:
+            self.streams_closed.wait()
 
 
 class ProcessRunner(Thread):
@@ -131,6 +366,7 @@ class ProcessRunner(Thread):
         self.process_args = process_args
         self.process_cwd = process_cwd
         self.process_env = process_env
+        self._resolved_cwd = str(process_cwd.resolve())
         self.runner_name = process_cwd.name
         self.capture_streams = capture_streams
 
@@ -159,16 +395,41 @@ class ProcessRunner(Thread):
         self.instance_id = instance.id
 
     def term(self):
-        """Kill the underlying plugin process with SIGKILL"""
+        """Terminate the underlying plugin process group with SIGTERM"""
         if self.process and self.process.poll() is None:
             self.logger.debug("About to send SIGTERM")
-            self.process.terminate()
+            self._signal_group(signal.SIGTERM)
 
     def kill(self):
-        """Kill the underlying plugin process with SIGKILL"""
+        """Kill the underlying plugin process group with SIGKILL"""
         if self.process and self.process.poll() is None:
             self.logger.warning("About to send SIGKILL")
-            self.process.kill()
+            self._signal_group(signal.SIGKILL)
+
+    def stream_loggers(self) -> List[Tuple[str, Path]]:
+        """Logger names and file paths used to capture STDOUT and STDERR"""
+        return [
+            (f"{self.runner_id}.stdout", self.process_cwd / "plugin.stdout"),
+            (f"{self.runner_id}.stderr", self.process_cwd / "plugin.stderr"),
+        ]
+
+    def release_streams(self):
+        """Close the captured output files if no other runner is using them"""
+        if self.capture_streams:
+            for name, path in self.stream_loggers():
+                release_stream_logger(name, path)
+
+    def _signal_group(self, sig: int):
+        """Send a signal to the plugin process and anything it has spawned
+
+        The plugin process is started in its own session, so its process group ID is
+        the same as its PID.
+        """
+        try:
+            os.killpg(self.process.pid, sig)
+        except ProcessLookupError:
+            # The process exited after it was polled
+            pass
 
     def run(self):
         """Runs the plugin process
@@ -182,7 +443,7 @@ class ProcessRunner(Thread):
             self.process = self._get_process(
                 args=self.process_args,
                 env=self.process_env,
-                cwd=str(self.process_cwd.resolve()),
+                cwd=self._resolved_cwd,
                 capture_streams=self.capture_streams,
             )
 
@@ -212,7 +473,7 @@ class ProcessRunner(Thread):
             cwd=cwd,
             restore_signals=False,
             close_fds=True,
-            text=True,
+            start_new_session=True,
             stdout=subprocess.PIPE if capture_streams else None,
             stderr=subprocess.PIPE if capture_streams else None,
         )
@@ -4,9 +4,12 @@
 These are abstract classes generated to be utilizes for functions based off OS file events
 """
 from pathlib import Path
+from threading import Lock, Timer
+from time import monotonic
+from typing import Dict, Tuple
 
 from watchdog.events import PatternMatchingEventHandler
-from watchdog.observers.polling import PollingObserver
+from watchdog.observers import Observer
 
 from beer_garden.db.mongo.models import Event
 from beer_garden.events import publish
@@ -15,8 +18,11 @@ from beer_garden.events import publish
 class MonitorFile(PatternMatchingEventHandler):
     """Monitor files and create Beergarden events
 
-    This is a wrapper around a watchdog PollingObserver. PollingObserver is used instead
-    of Observer because Observer throws events on each file transaction.
+    This is a wrapper around a watchdog Observer, which uses the native OS file
+    notification API (inotify, FSEvents, etc.) instead of periodically scanning the
+    directory. Because the native observers report every file transaction, events are
+    debounced: a Beergarden event is only published once the file has been quiet for
+    ``debounce`` seconds.
 
     Note that the events generated are NOT watchdog events, they are whatever
     Beergarden events are specified during initialization.
@@ -30,11 +36,17 @@ class MonitorFile(PatternMatchingEventHandler):
         modify_event: Event = None,
         moved_event: Event = None,
         deleted_event: Event = None,
+        debounce: float = 0.5,
     ):
         super().__init__(patterns=[path], ignore_directories=True)
 
         self._path = path
-        self._observer = PollingObserver()
+        self._observer = Observer()
+
+        # Deadline and timer for each Beergarden event waiting to be published
+        self._debounce = debounce
+        self._pending: Dict[int, Tuple[float, Timer]] = {}
+        self._pending_lock = Lock()
 
         self.create_event = create_event
         self.modify_event = modify_event
@@ -50,6 +62,11 @@ class MonitorFile(PatternMatchingEventHandler):
             self._observer.stop()
             self._observer.join()
 
+        with self._pending_lock:
+            for _, timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+
     def on_created(self, _):
         """Callback invoked when the file is created
 
@@ -57,7 +74,7 @@ class MonitorFile(PatternMatchingEventHandler):
         captures that case
         """
         if self.create_event:
-            publish(self.create_event)
+            self._publish(self.create_event)
 
     def on_modified(self, _):
         """Callback invoked when the file is modified
@@ -65,7 +82,7 @@ class MonitorFile(PatternMatchingEventHandler):
         This captures all other modification events that occur against the file
         """
         if self.modify_event:
-            publish(self.modify_event)
+            self._publish(self.modify_event)
 
     def on_moved(self, _):
         """Callback invoked when the file is moved
@@ -73,7 +90,7 @@ class MonitorFile(PatternMatchingEventHandler):
         This captures if the file is moved into or from the directory
         """
         if self.moved_event:
-            publish(self.moved_event)
+            self._publish(self.moved_event)
 
     def on_deleted(self, _):
         """Callback invoked when the file is deleted
@@ -82,4 +99,49 @@ class MonitorFile(PatternMatchingEventHandler):
         default during write actions)
         """
         if self.deleted_event:
-            publish(self.deleted_event)
+            self._publish(self.deleted_event)
+
+    def _publish(self, event: Event) -> None:
+        """Publish an event once no more file events have arrived for a while
+
+        Each call pushes back the deadline for the given event, so a burst of file
+        transactions results in a single publish after the burst has finished. Only
+        the deadline changes, the timer already waiting for the event is reused.
+        """
+        deadline = monotonic() + self._debounce
+
+        with self._pending_lock:
+            pending = self._pending.get(id(event))
+
+            if pending:
+                self._pending[id(event)] = (deadline, pending[1])
+            else:
+                self._schedule(event, deadline, self._debounce)
+
+    def _schedule(self, event: Event, deadline: float, delay: float) -> None:
+        # Must be called with the pending lock held
+        timer = Timer(delay, self._fire, args=(event,))
+        timer.daemon = True
+
+        self._pending[id(event)] = (deadline, timer)
+
+        timer.start()
+
+    def _fire(self, event: Event) -> None:
+        with self._pending_lock:
+            pending = self._pending.get(id(event))
+
+            # Stopped while the timer was waiting
+            if not pending:
+                return
+
+            # More file events arrived since the timer was started, so wait for the rest
+            # of the new debounce period
+            remaining = pending[0] - monotonic()
+            if remaining > 0:
+                self._schedule(event, pending[0], remaining)
+                return
+
+            del self._pending[id(event)]
+
+        publish(event)
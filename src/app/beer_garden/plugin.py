@@ -25,6 +25,7 @@ from typing import Tuple
 from brewtils.models import Event, Events, Instance, Request, RequestTemplate, System
 from brewtils.schema_parser import SchemaParser
 from brewtils.stoppable_thread import StoppableThread
+from mongoengine import Q
 from mongoengine.fields import ObjectIdField
 
 import beer_garden.config as config
@@ -465,6 +466,10 @@ def handle_event(event: Event) -> None:
                 logger.error(f"{event.name} error: {ex} ({event!r})")
 
 
+# Statuses that an instance should move out of (to RUNNING) once it's heartbeating
+_revivable_statuses = frozenset(["UNRESPONSIVE", "STARTING", "INITIALIZING", "UNKNOWN"])
+
+
 class StatusMonitor(StoppableThread):
     """Monitor plugin heartbeats and update plugin status"""
 
@@ -500,21 +505,48 @@ class StatusMonitor(StoppableThread):
 
     def check_status(self):
         """Update instance status if necessary"""
+        # Heartbeats are compared against a single point in time for the whole pass
+        now = datetime.utcnow()
+        timeout = self.timeout
+        cutoff = now - timeout
+
+        # Let the database find the systems with an instance whose status needs to
+        # change, so when everything is healthy nothing comes back. Only load what's
+        # needed to check the heartbeats, update() will write (and return) the full
+        # instance if its status changes.
+        systems = db.query(
+            System,
+            q_filter=(
+                Q(
+                    instances__match={
+                        "status": "RUNNING",
+                        "status_info__heartbeat__lte": cutoff,
+                    }
+                )
+                | Q(
+                    instances__match={
+                        "status__in": list(_revivable_statuses),
+                        "status_info__heartbeat__gt": cutoff,
+                    }
+                )
+            ),
+            filter_params={"local": True},
+            include_fields=[
+                "instances.name",
+                "instances.status",
+                "instances.status_info",
+            ],
+        )
 
-        for system in db.query(
-            System, filter_params={"local": True}, include_fields=["instances"]
-        ):
+        for system in systems:
             for instance in system.instances:
                 if self.stopped():
-                    break
+                    return
 
                 last_heartbeat = instance.status_info["heartbeat"]
 
                 if last_heartbeat:
-                    if (
-                        instance.status == "RUNNING"
-                        and datetime.utcnow() - last_heartbeat >= self.timeout
-                    ):
+                    if instance.status == "RUNNING" and now - last_heartbeat >= timeout:
                         update(
                             system=system,
                             instance=instance,
@@ -523,9 +555,8 @@ class StatusMonitor(StoppableThread):
                         )
 
                     elif (
-                        instance.status
-                        in ["UNRESPONSIVE", "STARTING", "INITIALIZING", "UNKNOWN"]
-                        and datetime.utcnow() - last_heartbeat < self.timeout
+                        instance.status in _revivable_statuses
+                        and now - last_heartbeat < timeout
                     ):
                         update(
                             system=system,
@@ -168,6 +168,25 @@ route_functions = {
     ),
 }
 
+# Operations that are ASSUMED to be targeted at the local garden. Membership is
+# worked out once here so routing doesn't have to pattern-match the operation type.
+local_operations = frozenset(
+    operation_type
+    for operation_type in route_functions
+    if "READ" in operation_type
+    or "JOB" in operation_type
+    or "FILE" in operation_type
+    or "PUBLISH_EVENT" in operation_type
+    or "RUNNER" in operation_type
+    or operation_type
+    in (
+        "PLUGIN_LOG_RELOAD",
+        "QUEUE_DELETE_ALL",
+        "SYSTEM_CREATE",
+        "SYSTEM_RESCAN",
+    )
+)
+
 
 def route(operation: Operation):
     """Entry point into the routing subsystem
@@ -185,7 +204,7 @@ def route(operation: Operation):
     if not operation.operation_type:
         raise RoutingRequestException("Missing operation type")
 
-    if operation.operation_type not in route_functions.keys():
+    if operation.operation_type not in route_functions:
         raise RoutingRequestException(
             f"Unknown operation type '{operation.operation_type}'"
         )
@@ -210,30 +229,28 @@ def execute_local(operation: Operation):
 
     """
     operation = _pre_execute(operation)
+    operation_type = operation.operation_type
 
-    # Default to "normal"
-    lookup = route_functions
-
-    loop = None
+    # Only a thread that is currently running an event loop is an async context
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
     except RuntimeError:
-        pass
-
-    if loop and operation.operation_type in async_functions:
-        lookup = async_functions
-
-    elif loop and operation.operation_type in executor_functions:
-        return asyncio.get_event_loop().run_in_executor(
-            t_pool,
-            partial(
-                executor_functions[operation.operation_type],
-                *operation.args,
-                **operation.kwargs,
-            ),
-        )
+        loop = None
 
-    return lookup[operation.operation_type](*operation.args, **operation.kwargs)
+    if loop:
+        function = async_functions.get(operation_type)
+        if function:
+            return function(*operation.args, **operation.kwargs)
+
+        function = executor_functions.get(operation_type)
+        if function:
+            # run_in_executor only passes positional args through
+            if operation.kwargs:
+                function = partial(function, **operation.kwargs)
+
+            return loop.run_in_executor(t_pool, function, *operation.args)
+
+    return route_functions[operation_type](*operation.args, **operation.kwargs)
 
 
 def initiate_forward(operation: Operation):
@@ -569,22 +586,7 @@ def _determine_target(operation: Operation) -> str:
 
 def _target_from_type(operation: Operation) -> str:
     """Determine the target garden based on the operation type"""
-    # Certain operations are ASSUMED to be targeted at the local garden
-    if (
-        "READ" in operation.operation_type
-        or "JOB" in operation.operation_type
-        or "FILE" in operation.operation_type
-        or operation.operation_type
-        in (
-            "PLUGIN_LOG_RELOAD",
-            "SYSTEM_CREATE",
-            "SYSTEM_RESCAN",
-        )
-        or "PUBLISH_EVENT" in operation.operation_type
-        or "RUNNER" in operation.operation_type
-        or operation.operation_type
-        in ("PLUGIN_LOG_RELOAD", "QUEUE_DELETE_ALL", "SYSTEM_CREATE")
-    ):
+    if operation.operation_type in local_operations:
         return config.get("garden.name")
 
     if operation.operation_type in (
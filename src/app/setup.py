@@ -7,13 +7,15 @@ with open("README.rst") as readme_file:
 
 
 def find_version(version_file):
-    version_line = open(version_file, "rt").read()
-    match_object = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", version_line, re.M)
+    with open(version_file, "rt") as f:
+        for line in f:
+            if line.startswith("__version__"):
+                match_object = re.match(r"__version__ = ['\"]([^'\"]*)['\"]", line)
 
-    if not match_object:
-        raise RuntimeError("Unable to find version string in %s" % version_file)
+                if match_object:
+                    return match_object.group(1)
 
-    return match_object.group(1)
+    raise RuntimeError("Unable to find version string in %s" % version_file)
 
 
 setup(
@@ -36,6 +38,7 @@ setup(
         "mongoengine<0.21",
         "more-itertools<9",
         "motor<3",
+        "orjson<4",
         "passlib<1.8",
         "prometheus-client<1",
         "pyyaml<6",
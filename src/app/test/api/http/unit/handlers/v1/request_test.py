@@ -317,6 +317,37 @@ class TestRequestAPI:
         assert response.code == 200
         assert Request.objects.get(id=request_permitted.id).status == "IN_PROGRESS"
 
+    @pytest.mark.gen_test
+    @pytest.mark.parametrize("charset", ["utf-8", "UTF8", "utf-16"])
+    def test_patch_honors_charset(
+        self,
+        http_client,
+        base_url,
+        app_config_auth_enabled,
+        access_token,
+        request_permitted,
+        charset,
+    ):
+        url = f"{base_url}/api/v1/requests/{request_permitted.id}"
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": f"application/json; charset={charset}",
+        }
+
+        patch_body = [
+            {"operation": "replace", "path": "/status", "value": "IN_PROGRESS"}
+        ]
+        request = HTTPRequest(
+            url,
+            method="PATCH",
+            headers=headers,
+            body=json.dumps(patch_body).encode(charset),
+        )
+        response = yield http_client.fetch(request)
+
+        assert response.code == 200
+        assert Request.objects.get(id=request_permitted.id).status == "IN_PROGRESS"
+
     @pytest.mark.gen_test
     def test_auth_enabled_rejects_patch_for_not_permitted_request(
         self,
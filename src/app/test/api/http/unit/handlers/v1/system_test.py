@@ -5,6 +5,10 @@ import beer_garden.events
 import beer_garden.router
 import pytest
 from beer_garden.api.http.authentication import issue_token_pair
+from beer_garden.api.http.handlers.v1.system import (
+    _remove_queue_info,
+    _serialize_sans_queue,
+)
 from beer_garden.db.mongo.models import (
     Command,
     Garden,
@@ -17,6 +21,8 @@ from beer_garden.systems import create_system
 from brewtils.models import Command as BrewtilsCommand
 from brewtils.models import Instance as BrewtilsInstance
 from brewtils.models import System as BrewtilsSystem
+from brewtils.schema_parser import SchemaParser
+from mock import Mock
 from tornado.httpclient import HTTPError, HTTPRequest
 
 
@@ -169,6 +175,22 @@ class TestSystemAPI:
         assert response.code == 200
         assert response_body["id"] == str(system_not_permitted.id)
 
+    @pytest.mark.gen_test
+    @pytest.mark.parametrize("include_commands,expected", [("", 1), ("false", 0)])
+    def test_get_include_commands(
+        self, http_client, base_url, system_not_permitted, include_commands, expected
+    ):
+        url = (
+            f"{base_url}/api/v1/systems/{system_not_permitted.id}"
+            f"?include_commands={include_commands}"
+        )
+
+        response = yield http_client.fetch(url)
+        response_body = json.loads(response.body.decode("utf-8"))
+
+        assert response.code == 200
+        assert len(response_body["commands"]) == expected
+
     @pytest.mark.gen_test
     def test_auth_enabled_returns_permitted_system(
         self,
@@ -447,3 +469,83 @@ class TestSystemListAPI:
 
         assert "queue_info" not in instance
         assert "queue_type" not in instance
+
+    @pytest.mark.gen_test
+    def test_get_include_fields(self, http_client, base_url):
+        url = f"{base_url}/api/v1/systems?include_fields=name,namespace,notafield"
+
+        response = yield http_client.fetch(url)
+        response_body = json.loads(response.body.decode("utf-8"))
+
+        assert response.code == 200
+        assert len(response_body) == 2
+        for system in response_body:
+            assert system["name"]
+            assert system["namespace"]
+            assert system["version"] is None
+            assert system["commands"] == []
+
+    @pytest.mark.gen_test
+    def test_get_exclude_fields(self, http_client, base_url):
+        url = f"{base_url}/api/v1/systems?exclude_fields=commands,notafield"
+
+        response = yield http_client.fetch(url)
+        response_body = json.loads(response.body.decode("utf-8"))
+
+        assert response.code == 200
+        assert len(response_body) == 2
+        for system in response_body:
+            assert system["name"]
+            assert system["commands"] == []
+
+    @pytest.mark.gen_test
+    def test_get_filter_params(self, http_client, base_url, system_permitted):
+        url = f"{base_url}/api/v1/systems?name=nope&name={system_permitted.name}"
+
+        response = yield http_client.fetch(url)
+        response_body = json.loads(response.body.decode("utf-8"))
+
+        assert response.code == 200
+        assert len(response_body) == 1
+        assert response_body[0]["id"] == str(system_permitted.id)
+
+    @pytest.mark.gen_test
+    def test_get_filter_params_control_chars(
+        self, http_client, base_url, system_permitted
+    ):
+        url = f"{base_url}/api/v1/systems?name=%01{system_permitted.name}%20"
+
+        response = yield http_client.fetch(url)
+        response_body = json.loads(response.body.decode("utf-8"))
+
+        assert response.code == 200
+        assert len(response_body) == 1
+        assert response_body[0]["id"] == str(system_permitted.id)
+
+    @pytest.mark.gen_test
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("", True),
+            ("?dereference_nested=TRUE", True),
+            ("?dereference_nested=no", False),
+        ],
+    )
+    def test_get_dereference_nested(
+        self, http_client, base_url, monkeypatch, query, expected
+    ):
+        get_systems_mock = Mock(return_value=[])
+        monkeypatch.setitem(
+            beer_garden.router.route_functions, "SYSTEM_READ_ALL", get_systems_mock
+        )
+
+        response = yield http_client.fetch(f"{base_url}/api/v1/systems{query}")
+
+        assert response.code == 200
+        assert get_systems_mock.call_args[1]["dereference_nested"] is expected
+
+
+def test_serialize_sans_queue_matches_remove_queue_info(bg_system):
+    expected = json.loads(_remove_queue_info(SchemaParser.serialize(bg_system, True)))
+
+    assert json.loads(_serialize_sans_queue(bg_system)) == expected
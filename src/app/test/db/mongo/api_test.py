@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 import pytest
 from box import Box
+from brewtils.models import System as BrewtilsSystem
 from mock import Mock
-from mongoengine import ConnectionFailure
+from mongoengine import ConnectionFailure, DoesNotExist, MultipleObjectsReturned
 
 import beer_garden.db.mongo.api
+from beer_garden.db.mongo.models import System
 
 
 class TestCheckConnection(object):
@@ -43,3 +45,36 @@ class TestCheckConnection(object):
         monkeypatch.setattr(beer_garden.db.mongo.api, "connect", connect_mock)
 
         assert beer_garden.db.mongo.api.check_connection(db_config) is False
+
+
+class TestQueryUnique(object):
+    @pytest.fixture(autouse=True)
+    def systems(self):
+        for version in ["1.0.0", "2.0.0"]:
+            System(name="system", version=version, namespace="ns").save()
+
+        yield
+
+        System.drop_collection()
+
+    def test_found(self):
+        system = beer_garden.db.mongo.api.query_unique(BrewtilsSystem, version="1.0.0")
+
+        assert isinstance(system, BrewtilsSystem)
+        assert system.version == "1.0.0"
+
+    def test_missing(self):
+        assert (
+            beer_garden.db.mongo.api.query_unique(BrewtilsSystem, version="3.0.0")
+            is None
+        )
+
+    def test_missing_raise(self):
+        with pytest.raises(DoesNotExist):
+            beer_garden.db.mongo.api.query_unique(
+                BrewtilsSystem, raise_missing=True, version="3.0.0"
+            )
+
+    def test_multiple(self):
+        with pytest.raises(MultipleObjectsReturned):
+            beer_garden.db.mongo.api.query_unique(BrewtilsSystem, name="system")
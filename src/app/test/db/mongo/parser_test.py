@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+from collections import OrderedDict
+
+import pytest
+from brewtils.models import PatchOperation, System
+from brewtils.schema_parser import SchemaParser
+
+from beer_garden.db.mongo.api import from_brewtils
+from beer_garden.db.mongo.models import System as MongoSystem
+from beer_garden.db.mongo.parser import MongoParser
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    MongoParser._schema_cache.schemas = OrderedDict()
+
+
+class TestMongoParser(object):
+    def test_parse_returns_mongo_model(self, bg_system):
+        system_dict = SchemaParser.serialize(bg_system, to_string=False)
+
+        assert isinstance(MongoParser.parse(system_dict, System), MongoSystem)
+
+    def test_parse_patch_is_always_many(self):
+        patch = MongoParser.parse(
+            '{"operation": "replace", "path": "/status", "value": "RUNNING"}',
+            PatchOperation,
+            from_string=True,
+            many=False,
+        )
+
+        assert len(patch) == 1
+        assert patch[0].operation == "replace"
+
+    def test_parse_from_string_requires_string(self):
+        with pytest.raises(TypeError):
+            MongoParser.parse({}, System, from_string=True)
+
+    def test_serialize_matches_schema_parser(self, bg_system):
+        mongo_system = from_brewtils(bg_system)
+
+        assert MongoParser.serialize(mongo_system) == SchemaParser.serialize(bg_system)
+
+    @pytest.mark.parametrize("to_string", [True, False])
+    def test_serialize_list_matches_schema_parser(self, bg_system, to_string):
+        mongo_systems = [from_brewtils(bg_system), from_brewtils(bg_system)]
+
+        serialized = MongoParser.serialize(mongo_systems, to_string=to_string)
+        expected = SchemaParser.serialize([bg_system, bg_system], to_string=to_string)
+
+        if to_string:
+            serialized, expected = json.loads(serialized), json.loads(expected)
+
+        assert serialized == expected
+
+    def test_serialize_mixed_list(self, bg_system, bg_instance):
+        serialized = MongoParser.serialize([bg_system, bg_instance])
+
+        assert serialized == [
+            SchemaParser.serialize(bg_system),
+            SchemaParser.serialize(bg_instance),
+        ]
+
+    def test_schema_reused(self, bg_system):
+        mongo_system = from_brewtils(bg_system)
+        MongoParser._schema_cache.schemas = OrderedDict()
+
+        MongoParser.serialize(mongo_system, only=["name"])
+        MongoParser.serialize(mongo_system, only={"name"})
+        MongoParser.serialize(mongo_system, exclude=["commands"])
+
+        assert len(MongoParser._schema_cache.schemas) == 2
+
+    def test_schema_cache_bounded(self, monkeypatch, bg_system):
+        monkeypatch.setattr(MongoParser, "_schema_cache_size", 2)
+        mongo_system = from_brewtils(bg_system)
+
+        MongoParser.serialize(mongo_system, only=["name"])
+        MongoParser.serialize(mongo_system, only=["version"])
+        MongoParser.serialize(mongo_system, only=["name"])
+        MongoParser.serialize(mongo_system, only=["description"])
+
+        only_fields = [
+            dict(kwargs)["only"] for _, kwargs in MongoParser._schema_cache.schemas
+        ]
+        assert only_fields == [frozenset(["name"]), frozenset(["description"])]
+
+    def test_schema_cache_per_thread(self, bg_system):
+        mongo_system = from_brewtils(bg_system)
+        MongoParser.serialize(mongo_system)
+
+        thread_caches = []
+
+        def serialize():
+            MongoParser.serialize(mongo_system)
+            thread_caches.append(MongoParser._schema_cache.schemas)
+
+        thread = threading.Thread(target=serialize)
+        thread.start()
+        thread.join()
+
+        assert thread_caches[0] is not MongoParser._schema_cache.schemas
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+import beer_garden.json_util as json_util
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def use_orjson(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(json_util, "orjson", None)
+    elif json_util.orjson is None:
+        pytest.skip("orjson is not installed")
+
+
+@pytest.mark.usefixtures("use_orjson")
+class TestJsonUtil(object):
+    @pytest.mark.parametrize(
+        "data", ['{"a": [1, 2.5, "three", null, true]}', b'{"a": [1, 2.5]}']
+    )
+    def test_loads(self, data):
+        assert json_util.loads(data) == json.loads(data)
+
+    def test_loads_nan(self):
+        assert json_util.loads("[NaN]")[0] != json_util.loads("[NaN]")[0]
+
+    def test_loads_invalid(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_util.loads("{not json")
+
+    @pytest.mark.parametrize(
+        "obj", [{"a": [1, 2.5, "three", None, True]}, [], {1: "int key"}, [2**70]]
+    )
+    def test_dumps(self, obj):
+        dumped = json_util.dumps(obj)
+
+        assert isinstance(dumped, str)
+        assert json.loads(dumped) == json.loads(json.dumps(obj))
+
+    def test_dumps_unserializable(self):
+        with pytest.raises(TypeError):
+            json_util.dumps(object())
+
+    @pytest.mark.parametrize("obj", [{"a": [1, 2.5, "three", None, True]}, [2**70]])
+    def test_dumps_bytes(self, obj):
+        dumped = json_util.dumps_bytes(obj)
+
+        assert isinstance(dumped, bytes)
+        assert json.loads(dumped) == json.loads(json_util.dumps(obj))
@@ -1,4 +1,7 @@
 import logging
+import os
+import shutil
+import signal
 import string
 import subprocess
 import sys
@@ -7,7 +10,13 @@ from random import choice
 import pytest
 from mock import Mock, call
 
-from beer_garden.local_plugins.runner import ProcessRunner
+import beer_garden.local_plugins.runner
+from beer_garden.local_plugins.runner import (
+    OutputReader,
+    ProcessRunner,
+    release_stream_logger,
+    stream_logger,
+)
 
 
 @pytest.fixture
@@ -196,6 +205,167 @@ class TestCheckIo(object):
         assert check_io_mock.call_count > 1
 
 
+@pytest.fixture
+def output_reader():
+    reader = OutputReader()
+    reader.start()
+
+    yield reader
+
+    reader.stop()
+    reader.join(5)
+
+
+class TestOutputReader(object):
+    @staticmethod
+    def pipe(data):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, data)
+        os.close(write_fd)
+
+        return os.fdopen(read_fd, "rb")
+
+    def test_reads_until_eof(self, output_reader):
+        out_logger, err_logger = Mock(), Mock()
+        out_stream = self.pipe(b"line one\n\nline two \nno newline")
+        err_stream = self.pipe("caf\u00e9\r\n".encode("utf-8"))
+
+        streams = {out_stream: out_logger, err_stream: err_logger}
+
+        assert output_reader.add(streams).wait(5)
+
+        assert out_logger.info.mock_calls == [
+            call("line one"),
+            call(""),
+            call("line two "),
+            call("no newline"),
+        ]
+        assert err_logger.info.mock_calls == [call("caf\u00e9")]
+
+    def test_line_split_across_reads(self, monkeypatch, output_reader):
+        monkeypatch.setattr(beer_garden.local_plugins.runner, "READ_SIZE", 3)
+        logger = Mock()
+
+        assert output_reader.add({self.pipe(b"abcdefg\nhi\n"): logger}).wait(5)
+
+        assert logger.info.mock_calls == [call("abcdefg"), call("hi")]
+
+    def test_multiple_groups(self, output_reader):
+        first_logger, second_logger = Mock(), Mock()
+        read_fd, write_fd = os.pipe()
+
+        first = output_reader.add({os.fdopen(read_fd, "rb"): first_logger})
+        second = output_reader.add({self.pipe(b"second\n"): second_logger})
+
+        assert second.wait(5)
+        assert not first.is_set()
+
+        os.write(write_fd, b"first\n")
+        os.close(write_fd)
+
+        assert first.wait(5)
+        assert first_logger.info.mock_calls == [call("first")]
+        assert second_logger.info.mock_calls == [call("second")]
+
+    def test_no_streams(self, output_reader):
+        assert output_reader.add({}).is_set()
+
+    def test_logger_error(self, output_reader):
+        bad_logger, good_logger = Mock(), Mock()
+        bad_logger.info.side_effect = ValueError
+
+        assert output_reader.add({self.pipe(b"bad\n"): bad_logger}).wait(5)
+        assert output_reader.add({self.pipe(b"good\n"): good_logger}).wait(5)
+
+        assert good_logger.info.mock_calls == [call("good")]
+
+    def test_stop(self, output_reader):
+        read_fd, write_fd = os.pipe()
+        streams_closed = output_reader.add({os.fdopen(read_fd, "rb"): Mock()})
+
+        output_reader.stop()
+        output_reader.join(5)
+
+        assert not output_reader.is_alive()
+        assert streams_closed.is_set()
+        assert output_reader.add({self.pipe(b""): Mock()}).is_set()
+
+        os.close(write_fd)
+
+
+class TestStreamLogger(object):
+    def test_handler_added_once(self, tmp_path):
+        path = tmp_path / "plugin.stdout"
+
+        first = stream_logger("stream_logger_test.stdout", path)
+        second = stream_logger("stream_logger_test.stdout", path)
+
+        assert first is second
+        assert len(first.handlers) == 1
+
+    def test_handler_shared(self, tmp_path):
+        path = tmp_path / "plugin.stdout"
+
+        one = stream_logger("stream_logger_test_one.stdout", path)
+        two = stream_logger("stream_logger_test_two.stdout", path)
+
+        assert one.handlers == two.handlers
+
+    def test_directory_recreated(self, tmp_path):
+        plugin_dir = tmp_path / "plugin"
+        plugin_dir.mkdir()
+        path = plugin_dir / "plugin.stdout"
+
+        stream_logger("stream_logger_test_recreated.stdout", path).info("first")
+
+        shutil.rmtree(plugin_dir)
+        plugin_dir.mkdir()
+
+        logger = stream_logger("stream_logger_test_recreated.stdout", path)
+        assert path.exists()
+
+        logger.info("second")
+        assert path.read_text().endswith(
+            "stream_logger_test_recreated.stdout: second\n"
+        )
+
+    def test_emit_does_not_stat(self, monkeypatch, tmp_path):
+        logger = stream_logger("stream_logger_test_stat.stdout", tmp_path / "out")
+        stat_mock = Mock(wraps=os.stat)
+        monkeypatch.setattr(os, "stat", stat_mock)
+
+        logger.info("line")
+
+        assert not stat_mock.called
+
+    def test_release(self, tmp_path):
+        path = tmp_path / "plugin.stdout"
+
+        one = stream_logger("stream_logger_test_release_one.stdout", path)
+        two = stream_logger("stream_logger_test_release_two.stdout", path)
+        handler = one.handlers[0]
+
+        release_stream_logger("stream_logger_test_release_one.stdout", path)
+        assert not one.handlers
+        assert handler.stream
+
+        release_stream_logger("stream_logger_test_release_two.stdout", path)
+        assert not two.handlers
+        assert handler.stream is None
+        assert path not in beer_garden.local_plugins.runner._stream_handlers
+
+    def test_release_streams(self, tmp_path, runner):
+        runner.capture_streams = True
+        loggers = [stream_logger(*name) for name in runner.stream_loggers()]
+
+        runner.release_streams()
+
+        assert not any(logger.handlers for logger in loggers)
+        assert tmp_path / "plugin.stdout" not in (
+            beer_garden.local_plugins.runner._stream_handlers
+        )
+
+
 class TestRun(object):
     def test_exception(self, caplog, monkeypatch, runner):
         monkeypatch.setattr(
@@ -210,15 +380,49 @@ class TestRun(object):
 
 
 class TestKill(object):
-    def test_alive(self, runner):
-        runner.process = Mock(poll=Mock(return_value=None))
+    @pytest.fixture
+    def killpg_mock(self, monkeypatch):
+        killpg_mock = Mock()
+        monkeypatch.setattr(os, "killpg", killpg_mock)
+
+        return killpg_mock
+
+    def test_alive(self, runner, killpg_mock):
+        runner.process = Mock(pid=123, poll=Mock(return_value=None))
+        runner.kill()
+        killpg_mock.assert_called_once_with(123, signal.SIGKILL)
+
+    def test_dead(self, runner, killpg_mock):
+        runner.process = Mock(pid=123, poll=Mock(return_value="dead"))
         runner.kill()
-        assert runner.process.kill.called
+        assert not killpg_mock.called
 
-    def test_dead(self, runner):
-        runner.process = Mock(poll=Mock(return_value="dead"))
+    def test_exited_after_poll(self, runner, killpg_mock):
+        killpg_mock.side_effect = ProcessLookupError
+        runner.process = Mock(pid=123, poll=Mock(return_value=None))
         runner.kill()
-        assert not runner.process.kill.called
+
+
+class TestTerm(object):
+    def test_alive(self, monkeypatch, runner):
+        killpg_mock = Mock()
+        monkeypatch.setattr(os, "killpg", killpg_mock)
+
+        runner.process = Mock(pid=123, poll=Mock(return_value=None))
+        runner.term()
+        killpg_mock.assert_called_once_with(123, signal.SIGTERM)
+
+    def test_process_group(self, tmp_path, runner):
+        runner.process = runner._get_process(
+            args=[sys.executable, "-c", "import time; time.sleep(30)"],
+            env={},
+            cwd=str(tmp_path),
+        )
+
+        assert os.getpgid(runner.process.pid) == runner.process.pid
+
+        runner.term()
+        assert runner.process.wait(timeout=10) == -signal.SIGTERM
 
 
 class TestBadPlugin:
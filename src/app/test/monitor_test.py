@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import pytest
+from mock import Mock
+
+import beer_garden.monitor
+from beer_garden.monitor import MonitorFile
+
+
+@pytest.fixture
+def publish_mock(monkeypatch):
+    publish_mock = Mock()
+    monkeypatch.setattr(beer_garden.monitor, "publish", publish_mock)
+
+    return publish_mock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Mock(return_value=100.0)
+    monkeypatch.setattr(beer_garden.monitor, "monotonic", clock)
+
+    return clock
+
+
+@pytest.fixture
+def timer_mock(monkeypatch):
+    timer_mock = Mock(side_effect=lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(beer_garden.monitor, "Timer", timer_mock)
+
+    return timer_mock
+
+
+@pytest.fixture
+def monitor(tmp_path, clock, timer_mock):
+    event = Mock(name="file_event")
+    monitor = MonitorFile(
+        path=str(tmp_path / "config.yaml"),
+        create_event=event,
+        modify_event=event,
+        debounce=0.5,
+    )
+
+    yield monitor
+
+    monitor.stop()
+
+
+def fire(timer_mock):
+    """Run the most recently created timer's function"""
+    args, kwargs = timer_mock.call_args
+    args[1](*kwargs["args"])
+
+
+class TestMonitorFile(object):
+    def test_burst_uses_one_timer(self, monitor, timer_mock, clock):
+        monitor.on_deleted(None)
+        monitor.on_created(None)
+        clock.return_value = 100.2
+        monitor.on_modified(None)
+        monitor.on_modified(None)
+
+        deadline, timer = monitor._pending[id(monitor.modify_event)]
+
+        assert timer_mock.call_count == 1
+        assert timer_mock.call_args[0][0] == 0.5
+        timer.start.assert_called_once()
+        assert deadline == pytest.approx(100.7)
+
+    def test_burst_publishes_once(self, monitor, publish_mock, timer_mock, clock):
+        monitor.on_created(None)
+        clock.return_value = 100.2
+        monitor.on_modified(None)
+
+        # The first timer expires before the new deadline, so it's rescheduled
+        clock.return_value = 100.5
+        fire(timer_mock)
+
+        assert not publish_mock.called
+        assert timer_mock.call_count == 2
+        assert timer_mock.call_args[0][0] == pytest.approx(0.2)
+
+        clock.return_value = 100.7
+        fire(timer_mock)
+
+        publish_mock.assert_called_once_with(monitor.modify_event)
+        assert not monitor._pending
+
+    def test_separate_events_publish_separately(
+        self, monitor, publish_mock, timer_mock, clock
+    ):
+        monitor.on_modified(None)
+        clock.return_value = 101.0
+        fire(timer_mock)
+
+        monitor.on_modified(None)
+        clock.return_value = 102.0
+        fire(timer_mock)
+
+        assert timer_mock.call_count == 2
+        assert publish_mock.call_count == 2
+
+    def test_stop_cancels_pending(self, monitor, publish_mock, timer_mock, clock):
+        monitor.on_modified(None)
+        timer = monitor._pending[id(monitor.modify_event)][1]
+
+        monitor.stop()
+        clock.return_value = 101.0
+        fire(timer_mock)
+
+        timer.cancel.assert_called_once()
+        assert not publish_mock.called
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+
 import pytest
 from mock import Mock, patch
 
 import beer_garden.monitor
+from beer_garden.db.mongo.models import Instance, System
 from beer_garden.plugin import StatusMonitor
 
 
@@ -76,6 +79,17 @@ class TestStatusMonitor(object):
         monitor.check_status()
         assert stopped_mock.called is True
 
+    def test_stop_skips_remaining_systems(self, monkeypatch, monitor, bg_system):
+        stopped_mock = Mock(return_value=True)
+        monkeypatch.setattr(monitor, "stopped", stopped_mock)
+
+        monkeypatch.setattr(
+            beer_garden.plugin.db, "query", Mock(return_value=[bg_system, bg_system])
+        )
+
+        monitor.check_status()
+        assert stopped_mock.call_count == 1
+
     def test_mark_as_unresponsive(self, monkeypatch, monitor, bg_system, bg_instance):
         stopped_mock = Mock(side_effect=[False, True])
         monkeypatch.setattr(monitor, "stopped", stopped_mock)
@@ -108,3 +122,53 @@ class TestStatusMonitor(object):
 
         monitor.check_status()
         assert update_mock.called is True
+
+
+class TestCheckStatusQuery(object):
+    @pytest.fixture
+    def systems(self):
+        now = datetime.utcnow()
+        old = now - timedelta(minutes=5)
+        ids = {}
+
+        for name, status, heartbeat in [
+            ("stale", "RUNNING", old),
+            ("healthy", "RUNNING", now),
+            ("revived", "UNRESPONSIVE", now),
+            ("still_dead", "UNRESPONSIVE", old),
+        ]:
+            ids[name] = (
+                System(
+                    name=name,
+                    version="1.0.0",
+                    namespace="ns",
+                    local=True,
+                    instances=[
+                        Instance(
+                            name="default",
+                            status=status,
+                            status_info={"heartbeat": heartbeat},
+                        )
+                    ],
+                )
+                .save()
+                .id
+            )
+
+        yield ids
+
+        System.drop_collection()
+
+    def test_only_changed_systems(self, monkeypatch, monitor, systems):
+        update_mock = Mock()
+        monkeypatch.setattr(beer_garden.plugin, "update", update_mock)
+
+        monitor.check_status()
+
+        updated = {
+            c[1]["system"].id: c[1]["new_status"] for c in update_mock.call_args_list
+        }
+        assert updated == {
+            str(systems["stale"]): "UNRESPONSIVE",
+            str(systems["revived"]): "RUNNING",
+        }
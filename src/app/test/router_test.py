@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+
 import pytest
 from brewtils.models import Operation
 from mock import Mock
@@ -6,7 +8,7 @@ from mock import Mock
 import beer_garden.garden
 import beer_garden.router
 from beer_garden.errors import UnknownGardenException
-from beer_garden.router import _determine_target
+from beer_garden.router import _determine_target, _target_from_type
 
 
 @pytest.fixture
@@ -52,3 +54,72 @@ class TestDetermineTarget:
         op.target_garden_name = "parent"
 
         assert _determine_target(op) == "child"
+
+
+class TestTargetFromType:
+    @pytest.mark.parametrize(
+        "operation_type",
+        [
+            "REQUEST_READ_ALL",
+            "JOB_CREATE",
+            "FILE_FETCH",
+            "RUNNER_START",
+            "SYSTEM_RESCAN",
+        ],
+    )
+    def test_local(self, monkeypatch, operation_type):
+        monkeypatch.setattr(beer_garden.router.config, "get", Mock(return_value="me"))
+
+        assert _target_from_type(Operation(operation_type=operation_type)) == "me"
+
+    def test_not_local(self, monkeypatch):
+        monkeypatch.setattr(beer_garden.router.config, "get", Mock(return_value="me"))
+        op = Operation(operation_type="USER_SYNC", target_garden_name="child")
+
+        assert _target_from_type(op) == "child"
+
+
+class TestExecuteLocal:
+    @pytest.fixture(autouse=True)
+    def functions(self, monkeypatch):
+        function = Mock(return_value="result")
+
+        monkeypatch.setattr(beer_garden.router, "_pre_execute", lambda op: op)
+        monkeypatch.setitem(beer_garden.router.route_functions, "TEST_OP", function)
+        monkeypatch.setitem(beer_garden.router.executor_functions, "TEST_OP", function)
+
+        return function
+
+    def test_no_running_loop(self, functions):
+        op = Operation(operation_type="TEST_OP", args=["arg"], kwargs={"key": "val"})
+
+        assert beer_garden.router.execute_local(op) == "result"
+        functions.assert_called_once_with("arg", key="val")
+
+    def test_running_loop_uses_executor(self, functions):
+        op = Operation(operation_type="TEST_OP", args=["arg"], kwargs={"key": "val"})
+
+        async def execute():
+            return await beer_garden.router.execute_local(op)
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(execute()) == "result"
+        finally:
+            loop.close()
+
+        functions.assert_called_once_with("arg", key="val")
+
+    def test_running_loop_without_kwargs(self, functions):
+        op = Operation(operation_type="TEST_OP", args=["arg"])
+
+        async def execute():
+            return await beer_garden.router.execute_local(op)
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(execute()) == "result"
+        finally:
+            loop.close()
+
+        functions.assert_called_once_with("arg")